@@ -0,0 +1,190 @@
+# analysis.py
+
+import zlib
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+# Demo stock data
+DEMO_STOCKS = {
+    'AAPL': {
+        'name': 'Apple Inc.',
+        'price': 178.25,
+        'change': 2.34,
+        'change_percent': 1.33,
+        'volume': 45234567,
+        'market_cap': 2800000000000,
+        'pe_ratio': 28.5,
+        'high_52w': 198.23,
+        'low_52w': 124.17
+    },
+    'MSFT': {
+        'name': 'Microsoft Corporation',
+        'price': 378.85,
+        'change': -1.22,
+        'change_percent': -0.32,
+        'volume': 23456789,
+        'market_cap': 2820000000000,
+        'pe_ratio': 32.1,
+        'high_52w': 384.30,
+        'low_52w': 245.61
+    },
+    'GOOGL': {
+        'name': 'Alphabet Inc.',
+        'price': 138.93,
+        'change': 3.45,
+        'change_percent': 2.55,
+        'volume': 34567890,
+        'market_cap': 1750000000000,
+        'pe_ratio': 25.8,
+        'high_52w': 153.78,
+        'low_52w': 102.21
+    },
+    'TSLA': {
+        'name': 'Tesla, Inc.',
+        'price': 248.50,
+        'change': -8.75,
+        'change_percent': -3.40,
+        'volume': 67890123,
+        'market_cap': 790000000000,
+        'pe_ratio': 78.2,
+        'high_52w': 299.29,
+        'low_52w': 138.80
+    },
+    'AMZN': {
+        'name': 'Amazon.com Inc.',
+        'price': 145.86,
+        'change': 1.23,
+        'change_percent': 0.85,
+        'volume': 28456789,
+        'market_cap': 1520000000000,
+        'pe_ratio': 45.3,
+        'high_52w': 170.00,
+        'low_52w': 118.35
+    }
+}
+
+def generate_historical_data(symbol, days=365):
+    """Generate realistic historical stock data"""
+    # crc32 is stable across processes, unlike str hash(), so every app sees the same data
+    np.random.seed(zlib.crc32(symbol.encode('utf-8')))
+    
+    base_price = DEMO_STOCKS[symbol]['price']
+    current_price = base_price * 0.8  # Start from 80% of current price
+    
+    dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
+    data = []
+    
+    for date in dates:
+        # Simulate realistic price movement
+        volatility = 0.02  # 2% daily volatility
+        trend = 0.0003  # Slight upward trend
+        change = np.random.normal(trend, volatility)
+        
+        current_price = max(current_price * (1 + change), 1)
+        
+        open_price = current_price
+        high_price = open_price * (1 + np.random.uniform(0, 0.03))
+        low_price = open_price * (1 - np.random.uniform(0, 0.03))
+        close_price = low_price + np.random.uniform(0, 1) * (high_price - low_price)
+        volume = np.random.randint(10000000, 50000000)
+        
+        data.append({
+            'Date': date,
+            'Open': round(open_price, 2),
+            'High': round(high_price, 2),
+            'Low': round(low_price, 2),
+            'Close': round(close_price, 2),
+            'Volume': volume
+        })
+        
+        current_price = close_price
+    
+    return pd.DataFrame(data)
+
+def calculate_technical_indicators(df):
+    """Calculate technical indicators"""
+    # Simple Moving Averages
+    df['SMA_20'] = df['Close'].rolling(window=20).mean()
+    df['SMA_50'] = df['Close'].rolling(window=50).mean()
+    
+    # RSI
+    delta = df['Close'].diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    rs = gain / loss
+    df['RSI'] = 100 - (100 / (1 + rs))
+    
+    # MACD
+    exp1 = df['Close'].ewm(span=12).mean()
+    exp2 = df['Close'].ewm(span=26).mean()
+    df['MACD'] = exp1 - exp2
+    df['MACD_Signal'] = df['MACD'].ewm(span=9).mean()
+    df['MACD_Histogram'] = df['MACD'] - df['MACD_Signal']
+    
+    return df
+
+def generate_investment_recommendation(df, stock_data):
+    """Generate investment recommendation based on technical analysis"""
+    latest_rsi = df['RSI'].iloc[-1]
+    latest_price = df['Close'].iloc[-1]
+    latest_sma20 = df['SMA_20'].iloc[-1]
+    latest_sma50 = df['SMA_50'].iloc[-1]
+    latest_macd = df['MACD'].iloc[-1]
+    latest_signal = df['MACD_Signal'].iloc[-1]
+    
+    score = 50  # Neutral score
+    reasons = []
+    
+    # RSI Analysis
+    if latest_rsi < 30:
+        score += 15
+        reasons.append("RSI indicates oversold conditions (bullish)")
+    elif latest_rsi > 70:
+        score -= 15
+        reasons.append("RSI indicates overbought conditions (bearish)")
+    
+    # Moving Average Analysis
+    if latest_price > latest_sma20 and latest_sma20 > latest_sma50:
+        score += 10
+        reasons.append("Price above both moving averages (bullish trend)")
+    elif latest_price < latest_sma20 and latest_sma20 < latest_sma50:
+        score -= 10
+        reasons.append("Price below both moving averages (bearish trend)")
+    
+    # MACD Analysis
+    if latest_macd > latest_signal:
+        score += 8
+        reasons.append("MACD above signal line (bullish momentum)")
+    else:
+        score -= 8
+        reasons.append("MACD below signal line (bearish momentum)")
+    
+    # Volume analysis
+    avg_volume = df['Volume'].tail(10).mean()
+    latest_volume = df['Volume'].iloc[-1]
+    if latest_volume > avg_volume * 1.2:
+        score += 5
+        reasons.append("Above average trading volume")
+    
+    # Determine recommendation
+    if score >= 65:
+        action = "BUY"
+        target_price = latest_price * 1.15
+        risk_level = "MEDIUM" if latest_rsi > 60 else "LOW"
+    elif score <= 35:
+        action = "SELL"
+        target_price = latest_price * 0.85
+        risk_level = "HIGH" if latest_rsi < 40 else "MEDIUM"
+    else:
+        action = "HOLD"
+        target_price = latest_price
+        risk_level = "MEDIUM"
+    
+    return {
+        'action': action,
+        'score': score,
+        'target_price': target_price,
+        'risk_level': risk_level,
+        'reasons': reasons
+    }
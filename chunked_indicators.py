@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Chunked Technical Indicators
+Streams a price history through the SMA/RSI/MACD calculations of
+calculate_technical_indicators in fixed-size blocks, so histories larger
+than memory can be processed and written to disk incrementally.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNKSIZE = 100_000
+
+SMA_WINDOWS = (20, 50)
+RSI_WINDOW = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+
+# Closes carried between blocks: the longest rolling window plus one for diff()
+OVERLAP = max(max(SMA_WINDOWS), RSI_WINDOW + 1)
+
+
+class _EwmState:
+    """Running weights of an adjusted ewm(span=...).mean() across blocks"""
+
+    def __init__(self, span):
+        self.span = span
+        self.decay = 1 - 2 / (span + 1)
+        self.weighted_sum = 0.0
+        self.weight_total = 0.0
+
+    def update(self, values):
+        # Weighted sums of the block alone, then fold in the decayed history.
+        # Missing values add no weight but still decay it (pandas' ignore_na=False)
+        observed = ~np.isnan(values)
+        fresh_sum = pd.Series(np.where(observed, values, 0.0)).ewm(span=self.span).sum().to_numpy()
+        fresh_total = pd.Series(observed.astype(float)).ewm(span=self.span).sum().to_numpy()
+        decays = self.decay ** np.arange(1, len(values) + 1)
+        weighted_sum = fresh_sum + decays * self.weighted_sum
+        weight_total = fresh_total + decays * self.weight_total
+        self.weighted_sum = weighted_sum[-1]
+        self.weight_total = weight_total[-1]
+        # No observation yet means no average, as in pandas
+        mean = np.full(len(values), np.nan)
+        np.divide(weighted_sum, weight_total, out=mean, where=weight_total > 0)
+        return mean
+
+
+class ChunkedIndicators:
+    """Carries rolling-window overlap and EWM state from one block to the next"""
+
+    def __init__(self):
+        self._tail = np.empty(0)
+        self._fast = _EwmState(MACD_FAST)
+        self._slow = _EwmState(MACD_SLOW)
+        self._signal = _EwmState(MACD_SIGNAL)
+
+    def process(self, chunk):
+        """Return the chunk with indicator columns, as a single pass would compute them"""
+        chunk = chunk.copy()
+        if chunk.empty:
+            return chunk
+        values = chunk['Close'].to_numpy(dtype=float)
+
+        # Prefix the carried closes (gaps included) so every window in this block is complete
+        close = pd.Series(np.concatenate([self._tail, values]))
+        start = len(self._tail)
+
+        for window in SMA_WINDOWS:
+            chunk[f'SMA_{window}'] = close.rolling(window=window).mean().to_numpy()[start:]
+
+        delta = close.diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=RSI_WINDOW).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=RSI_WINDOW).mean()
+        rs = gain / loss
+        chunk['RSI'] = (100 - (100 / (1 + rs))).to_numpy()[start:]
+
+        macd = self._fast.update(values) - self._slow.update(values)
+        chunk['MACD'] = macd
+        chunk['MACD_Signal'] = self._signal.update(macd)
+        chunk['MACD_Histogram'] = chunk['MACD'] - chunk['MACD_Signal']
+
+        self._tail = close.to_numpy()[-OVERLAP:]
+        return chunk
+
+
+def iter_indicator_chunks(chunks):
+    """Yield each block of a history with its indicator columns added"""
+    state = ChunkedIndicators()
+    for chunk in chunks:
+        yield state.process(chunk)
+
+
+def compute_indicators_to_csv(source, destination, chunksize=DEFAULT_CHUNKSIZE):
+    """Stream a CSV history through the indicators, appending results to destination"""
+    rows = 0
+    reader = pd.read_csv(source, chunksize=chunksize)
+    for i, chunk in enumerate(iter_indicator_chunks(reader)):
+        chunk.to_csv(destination, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+        rows += len(chunk)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute indicators for a history too large for memory")
+    parser.add_argument("source", help="CSV history with a Close column, oldest row first")
+    parser.add_argument("destination", help="CSV file to write")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per block")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    rows = compute_indicators_to_csv(args.source, args.destination, args.chunksize)
+    print(f"✅ Wrote {rows} rows to {args.destination} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
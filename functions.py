@@ -1,6 +1,7 @@
 # functions.py
 
 import yfinance as yf
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import streamlit as st
 
@@ -12,33 +13,87 @@ def download_data(ticker, start_date, end_date):
         st.error(f"Error downloading data: {e}")
         return None
 
-def plot_closing_price(data, ticker):
-    fig, ax = plt.subplots()
-    ax.plot(data['Close'], label='Closing Price')
-    ax.set_title(f"{ticker} Closing Price")
+# Chart builders create a figure's artists once; the update functions re-point
+# them at a ticker's data, so batch rendering (report.py) can reuse figures.
+
+def _date_axis(fig, ylabel):
+    ax = fig.add_subplot()
+    ax.xaxis_date()
     ax.set_xlabel("Date")
-    ax.set_ylabel("Price")
+    ax.set_ylabel(ylabel)
+    return ax
+
+def _dates(data):
+    return mdates.date2num(data.index.to_pydatetime())
+
+def _rescale(ax):
+    ax.relim()
+    ax.autoscale_view()
+
+def build_closing_price_chart(fig):
+    ax = _date_axis(fig, "Price")
+    (line,) = ax.plot([], [], label='Closing Price')
+    ax.legend()
+    return {'fig': fig, 'ax': ax, 'close': line}
+
+def update_closing_price_chart(chart, data, ticker):
+    chart['close'].set_data(_dates(data), data['Close'].to_numpy().ravel())
+    chart['ax'].set_title(f"{ticker} Closing Price")
+    _rescale(chart['ax'])
+
+def build_volume_chart(fig):
+    ax = _date_axis(fig, "Volume")
+    return {'fig': fig, 'ax': ax, 'bars': None}
+
+def update_volume_chart(chart, data, ticker):
+    dates = _dates(data)
+    volume = data['Volume'].to_numpy().ravel()
+    bars = chart['bars']
+    if bars is not None and len(bars) == len(dates):
+        # Same number of bars: move the existing rectangles instead of redrawing
+        for rect, x, v in zip(bars, dates, volume):
+            rect.set_x(x - rect.get_width() / 2)
+            rect.set_height(v)
+    else:
+        if bars is not None:
+            bars.remove()
+        chart['bars'] = chart['ax'].bar(dates, volume, color='orange')
+    chart['ax'].set_title(f"{ticker} Volume")
+    _rescale(chart['ax'])
+
+def build_moving_averages_chart(fig):
+    ax = _date_axis(fig, "Price")
+    (close,) = ax.plot([], [], label='Closing Price', color='blue')
+    (ma20,) = ax.plot([], [], label='20-Day MA', color='green')
+    (ma50,) = ax.plot([], [], label='50-Day MA', color='red')
     ax.legend()
+    return {'fig': fig, 'ax': ax, 'close': close, 'ma20': ma20, 'ma50': ma50}
+
+def update_moving_averages_chart(chart, data, ticker):
+    dates = _dates(data)
+    chart['close'].set_data(dates, data['Close'].to_numpy().ravel())
+    chart['ma20'].set_data(dates, data['Close'].rolling(window=20).mean().to_numpy().ravel())
+    chart['ma50'].set_data(dates, data['Close'].rolling(window=50).mean().to_numpy().ravel())
+    chart['ax'].set_title(f"{ticker} Moving Averages")
+    _rescale(chart['ax'])
+
+def plot_closing_price(data, ticker):
+    fig = plt.figure()
+    update_closing_price_chart(build_closing_price_chart(fig), data, ticker)
     st.pyplot(fig)
+    plt.close(fig)
 
 def plot_volume(data, ticker):
-    fig, ax = plt.subplots()
-    ax.bar(data.index, data['Volume'], color='orange')
-    ax.set_title(f"{ticker} Volume")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Volume")
+    fig = plt.figure()
+    update_volume_chart(build_volume_chart(fig), data, ticker)
     st.pyplot(fig)
+    plt.close(fig)
 
 def plot_moving_averages(data, ticker):
     data['MA20'] = data['Close'].rolling(window=20).mean()
     data['MA50'] = data['Close'].rolling(window=50).mean()
 
-    fig, ax = plt.subplots()
-    ax.plot(data['Close'], label='Closing Price', color='blue')
-    ax.plot(data['MA20'], label='20-Day MA', color='green')
-    ax.plot(data['MA50'], label='50-Day MA', color='red')
-    ax.set_title(f"{ticker} Moving Averages")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Price")
-    ax.legend()
+    fig = plt.figure()
+    update_moving_averages_chart(build_moving_averages_chart(fig), data, ticker)
     st.pyplot(fig)
+    plt.close(fig)
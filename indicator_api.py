@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Indicator API
+Serves precomputed price history, technical indicators and the investment
+recommendation as versioned, columnar JSON for the React dashboard.
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+from datetime import date
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from analysis import (DEMO_STOCKS, calculate_technical_indicators,
+                      generate_historical_data, generate_investment_recommendation)
+
+PAYLOAD_VERSION = 1
+API_PREFIX = f"/api/v{PAYLOAD_VERSION}/indicators/"
+
+# generate_historical_data seeds numpy's global RNG, so builds must not overlap
+_build_lock = threading.Lock()
+
+PERIOD_DAYS = {'5D': 5, '1M': 30, '3M': 90, '6M': 180, '1Y': 365}
+
+# Payload column name -> DataFrame column, and decimals kept on the wire
+PAYLOAD_COLUMNS = {
+    'open': ('Open', 2),
+    'high': ('High', 2),
+    'low': ('Low', 2),
+    'close': ('Close', 2),
+    'volume': ('Volume', 0),
+    'sma20': ('SMA_20', 4),
+    'sma50': ('SMA_50', 4),
+    'rsi': ('RSI', 4),
+    'macd': ('MACD', 4),
+    'signal': ('MACD_Signal', 4),
+    'histogram': ('MACD_Histogram', 4),
+}
+
+
+def _column_values(series, decimals):
+    """Round a column and turn NaN/inf into JSON nulls"""
+    values = series.to_numpy(dtype=float).round(decimals)
+    out = values.astype(object)
+    out[~np.isfinite(values)] = None
+    if decimals == 0:
+        return [None if v is None else int(v) for v in out]
+    return out.tolist()
+
+
+def build_payload(symbol, period):
+    """Build the columnar payload dict for one symbol and period"""
+    df = calculate_technical_indicators(generate_historical_data(symbol, PERIOD_DAYS[period]))
+    recommendation = generate_investment_recommendation(df, DEMO_STOCKS[symbol])
+    columns = {'date': df['Date'].dt.strftime('%Y-%m-%d').tolist()}
+    for name, (column, decimals) in PAYLOAD_COLUMNS.items():
+        columns[name] = _column_values(df[column], decimals)
+    return {
+        'version': PAYLOAD_VERSION,
+        'symbol': symbol,
+        'period': period,
+        'columns': columns,
+        'recommendation': {
+            'action': recommendation['action'],
+            'score': int(recommendation['score']),
+            'reasons': recommendation['reasons'],
+            'targetPrice': round(float(recommendation['target_price']), 2),
+            'riskLevel': recommendation['risk_level'],
+        },
+    }
+
+
+@lru_cache(maxsize=256)
+def encoded_payload(symbol, period, as_of):
+    """Serialised payload and its ETag; as_of keys the cache to the data's day"""
+    with _build_lock:
+        payload = build_payload(symbol, period)
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    etag = f'"v{PAYLOAD_VERSION}-{hashlib.sha256(body).hexdigest()[:20]}"'
+    return body, etag
+
+
+def etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header against our ETag"""
+    for token in if_none_match.split(','):
+        token = token.strip()
+        if token == '*':
+            return True
+        if token.startswith('W/'):
+            token = token[2:]
+        if token == etag:
+            return True
+    return False
+
+
+class IndicatorHandler(BaseHTTPRequestHandler):
+    """GET /api/v1/indicators/<SYMBOL>?period=1Y"""
+
+    def _send(self, status, body=b'', headers=None):
+        self.send_response(status)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Expose-Headers', 'ETag')
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _send_error(self, status, message):
+        body = json.dumps({'error': message}).encode('utf-8')
+        self._send(status, body, {'Content-Type': 'application/json'})
+
+    def do_OPTIONS(self):
+        self._send(204, headers={
+            'Access-Control-Allow-Methods': 'GET, HEAD, OPTIONS',
+            'Access-Control-Allow-Headers': 'If-None-Match',
+        })
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if not url.path.startswith(API_PREFIX):
+            self._send_error(404, "Not found")
+            return
+
+        symbol = url.path[len(API_PREFIX):].strip('/').upper()
+        period = parse_qs(url.query).get('period', ['1Y'])[0].upper()
+        if symbol not in DEMO_STOCKS:
+            self._send_error(404, f"Unknown symbol {symbol!r}")
+            return
+        if period not in PERIOD_DAYS:
+            self._send_error(400, f"Unknown period {period!r}")
+            return
+
+        body, etag = encoded_payload(symbol, period, date.today())
+        headers = {'ETag': etag, 'Cache-Control': 'public, max-age=300'}
+        if etag_matches(self.headers.get('If-None-Match', ''), etag):
+            self._send(304, headers=headers)
+            return
+        headers['Content-Type'] = 'application/json'
+        self._send(200, body, headers)
+
+    do_HEAD = do_GET
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve precomputed indicator payloads")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), IndicatorHandler)
+    print(f"📡 Serving indicator payloads on http://{args.host}:{args.port}{API_PREFIX}<SYMBOL>")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
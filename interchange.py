@@ -0,0 +1,130 @@
+# interchange.py
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+DEFAULT_ROW_GROUP_SIZE = 64_000
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+
+
+def _format_for(path, fmt=None):
+    """Pick 'parquet' or 'arrow' from an explicit format or the file extension"""
+    if fmt:
+        return fmt
+    lowered = str(path).lower()
+    if lowered.endswith(PARQUET_EXTENSIONS):
+        return 'parquet'
+    if lowered.endswith(ARROW_EXTENSIONS):
+        return 'arrow'
+    raise ValueError(f"Cannot infer file format from {path!r}; pass fmt='parquet' or fmt='arrow'")
+
+
+def to_arrow_table(data, date_column='Date'):
+    """Convert a DataFrame, list of row dicts or Arrow table to an Arrow table"""
+    if isinstance(data, pa.Table):
+        return data
+    if isinstance(data, pd.DataFrame):
+        # Shallow copy so renaming columns never touches the caller's frame
+        data = data.copy(deep=False)
+        if isinstance(data.columns, pd.MultiIndex):
+            data.columns = [column[0] for column in data.columns]
+        # yf.download indexes by 'Date' (daily) or 'Datetime' (intraday); keep
+        # either as the date column
+        if isinstance(data.index, pd.DatetimeIndex) and date_column not in data.columns:
+            data = data.rename_axis(date_column)
+        # Named or datetime indexes hold data; a default integer index does not
+        keep_index = any(name is not None for name in data.index.names)
+        return pa.Table.from_pandas(data.reset_index() if keep_index else data, preserve_index=False)
+    return pa.Table.from_pylist(list(data))
+
+
+def histories_to_table(histories, date_column='Date'):
+    """Stack {symbol: history DataFrame} into one table sorted by Symbol and date"""
+    tables = []
+    for symbol, history in histories.items():
+        table = to_arrow_table(history, date_column)
+        if date_column not in table.column_names:
+            raise ValueError(f"History for {symbol!r} needs a {date_column!r} column or a DatetimeIndex")
+        tables.append(table.append_column('Symbol', pa.array([symbol] * table.num_rows, pa.string())))
+    combined = pa.concat_tables(tables, promote_options='default')
+    # Sorting keeps each row group's Symbol/Date statistics tight for pushdown
+    return combined.sort_by([('Symbol', 'ascending'), (date_column, 'ascending')])
+
+
+def write_table(data, path, fmt=None, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+    """Write histories, indicator frames or recommendation rows as Parquet or Arrow IPC"""
+    table = to_arrow_table(data)
+    if _format_for(path, fmt) == 'parquet':
+        pq.write_table(table, path, row_group_size=row_group_size, compression='zstd')
+    else:
+        feather.write_feather(table, path, compression='uncompressed',
+                              chunksize=row_group_size)
+
+
+def table_to_bytes(data, fmt='parquet'):
+    """Serialise a table to bytes, e.g. for st.download_button"""
+    sink = pa.BufferOutputStream()
+    table = to_arrow_table(data)
+    if fmt == 'parquet':
+        pq.write_table(table, sink, compression='zstd')
+    else:
+        feather.write_feather(table, sink, compression='uncompressed')
+    return sink.getvalue().to_pybytes()
+
+
+def _bound(value, field):
+    """Convert a date/time bound to a scalar of the column's Arrow type"""
+    ts = pd.Timestamp(value)
+    if pa.types.is_timestamp(field.type):
+        if field.type.tz is None:
+            ts = ts.tz_convert(None) if ts.tz is not None else ts
+        else:
+            ts = ts.tz_localize(field.type.tz) if ts.tz is None else ts.tz_convert(field.type.tz)
+        return pa.scalar(ts.to_pydatetime(), type=field.type)
+    return pa.scalar(ts.date(), type=field.type)
+
+
+def _filter(schema, symbols=None, start=None, end=None, date_column='Date'):
+    expression = None
+    conditions = []
+    if symbols is not None:
+        conditions.append(ds.field('Symbol').isin(list(symbols)))
+    if start is not None:
+        conditions.append(ds.field(date_column) >= _bound(start, schema.field(date_column)))
+    if end is not None:
+        end = pd.Timestamp(end)
+        if end == end.normalize():
+            # A bare date includes the whole day, which matters for intraday data
+            conditions.append(ds.field(date_column) < _bound(end + pd.Timedelta(days=1),
+                                                             schema.field(date_column)))
+        else:
+            conditions.append(ds.field(date_column) <= _bound(end, schema.field(date_column)))
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def read_arrow_table(path, columns=None, symbols=None, start=None, end=None,
+                     fmt=None, date_column='Date'):
+    """Read an Arrow table, decoding only the requested columns and matching row groups"""
+    # start and end are inclusive; a bare end date covers that whole day
+    if _format_for(path, fmt) == 'parquet':
+        dataset = ds.dataset(path, format='parquet')
+    else:
+        # Memory-map IPC files so unread columns are never paged in
+        dataset = ds.dataset(path, format='ipc', filesystem=pafs.LocalFileSystem(use_mmap=True))
+    return dataset.to_table(columns=columns,
+                            filter=_filter(dataset.schema, symbols, start, end, date_column))
+
+
+def read_frame(path, columns=None, symbols=None, start=None, end=None,
+               fmt=None, date_column='Date'):
+    """Same as read_arrow_table, converted to a pandas DataFrame"""
+    table = read_arrow_table(path, columns, symbols, start, end, fmt, date_column)
+    return table.to_pandas()
@@ -1,10 +1,21 @@
 import streamlit as st
 import pandas as pd
+import os
 from functions import download_data, plot_closing_price, plot_volume, plot_moving_averages
+from symbols import DEFAULT_PAGE_SIZE, load_symbol_directory
+
+SYMBOLS_FILE = os.environ.get("SYMBOLS_FILE", "symbols.csv")
 
 # Page Config
 st.set_page_config(page_title="📊 Stock Market Analyzer", layout="centered")
 
+@st.cache_resource
+def get_symbol_directory():
+    """Load the symbol listing once per process, or None if there is no listing file"""
+    if not os.path.exists(SYMBOLS_FILE):
+        return None
+    return load_symbol_directory(SYMBOLS_FILE)
+
 # Custom CSS for styling like Netlify page
 st.markdown("""
     <style>
@@ -27,11 +38,25 @@ with st.container():
     st.markdown('<div class="main">', unsafe_allow_html=True)
     st.markdown("<h1>📊 Stock Market Analyzer</h1>", unsafe_allow_html=True)
 
-    ticker = st.text_input("Enter Stock Ticker Symbol (e.g., AAPL, TSLA)", "AAPL")
+    ticker = st.text_input("Enter Stock Ticker Symbol (e.g., AAPL, TSLA)", "AAPL").strip().upper()
+
+    directory = get_symbol_directory()
+    if directory is not None and ticker and ticker not in directory:
+        suggestions = directory.search(ticker, limit=DEFAULT_PAGE_SIZE)
+        if suggestions:
+            # Keep the typed symbol as the default; the listing may simply be incomplete
+            ticker = st.radio(
+                "Symbol not in the listing. Did you mean:",
+                options=[ticker] + [symbol for symbol, _ in suggestions],
+                format_func=lambda x: f"{x} - {directory.name(x)}" if x in directory else f"Use {x} as typed"
+            )
+        else:
+            st.warning("⚠️ Ticker not found in the symbol listing.")
+
     start_date = st.date_input("Start Date", pd.to_datetime("2022-01-01"))
     end_date = st.date_input("End Date", pd.to_datetime("2023-01-01"))
 
-    if st.button("🔍 Analyze"):
+    if st.button("🔍 Analyze", disabled=not ticker):
         data = download_data(ticker, start_date, end_date)
 
         if data is not None and not data.empty:
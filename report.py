@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Headless Report Generator
+Renders the closing price, volume and moving average charts for a list of
+tickers to PNG or PDF files, spreading the work across a process pool.
+"""
+
+import matplotlib
+matplotlib.use("Agg")
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import yfinance as yf
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from functions import (build_closing_price_chart, build_moving_averages_chart, build_volume_chart,
+                       update_closing_price_chart, update_moving_averages_chart, update_volume_chart)
+
+CHARTS_PER_TICKER = 3
+
+# Per-process chart set, created once by the pool initializer
+_charts = None
+
+
+class ReportCharts:
+    """The functions.py charts, built once and re-pointed at each ticker's data"""
+
+    def __init__(self):
+        self.charts = [
+            (build_closing_price_chart(self._new_figure()), update_closing_price_chart),
+            (build_volume_chart(self._new_figure()), update_volume_chart),
+            (build_moving_averages_chart(self._new_figure()), update_moving_averages_chart),
+        ]
+
+    @staticmethod
+    def _new_figure():
+        # Figures are created without pyplot so nothing is kept in its global registry
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        return fig
+
+    @property
+    def figures(self):
+        return [chart['fig'] for chart, _ in self.charts]
+
+    def update(self, data, ticker):
+        """Point every chart's artists at a new ticker's history"""
+        for chart, update_chart in self.charts:
+            update_chart(chart, data, ticker)
+
+    def save(self, out_dir, ticker, fmt):
+        """Write the current charts, returning the number of charts rendered"""
+        if fmt == 'pdf':
+            with PdfPages(os.path.join(out_dir, f"{ticker}.pdf")) as pdf:
+                for fig in self.figures:
+                    pdf.savefig(fig)
+        else:
+            for name, fig in zip(['close', 'volume', 'moving_averages'], self.figures):
+                fig.savefig(os.path.join(out_dir, f"{ticker}_{name}.{fmt}"))
+        return CHARTS_PER_TICKER
+
+
+def _init_worker():
+    global _charts
+    _charts = ReportCharts()
+
+
+def render_ticker(ticker, data, out_dir, fmt='png'):
+    """Render one ticker's charts with this process's chart set"""
+    if _charts is None:
+        _init_worker()
+    _charts.update(data, ticker)
+    return _charts.save(out_dir, ticker, fmt)
+
+
+def _render_job(job):
+    ticker, start_date, end_date, out_dir, fmt = job
+    try:
+        data = yf.download(ticker, start=start_date, end=end_date, progress=False)
+        if data is None or data.empty:
+            return ticker, 0, "no data"
+        return ticker, render_ticker(ticker, data, out_dir, fmt), None
+    except Exception as e:
+        return ticker, 0, str(e)
+
+
+def generate_reports(tickers, start_date, end_date, out_dir, fmt='png', workers=None):
+    """Render reports for every ticker and return (charts, failures, seconds)"""
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(ticker, start_date, end_date, out_dir, fmt) for ticker in tickers]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+
+    charts = 0
+    failures = []
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for ticker, rendered, error in pool.map(_render_job, jobs, chunksize=chunksize):
+            charts += rendered
+            if error:
+                failures.append((ticker, error))
+    return charts, failures, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render stock chart reports without a UI")
+    parser.add_argument("tickers", nargs="*", help="Ticker symbols to render")
+    parser.add_argument("--tickers-file", help="File with one ticker symbol per line")
+    parser.add_argument("--start", default="2022-01-01", help="Start date (YYYY-MM-DD)")
+    parser.add_argument("--end", default="2023-01-01", help="End date (YYYY-MM-DD)")
+    parser.add_argument("--out", default="reports", help="Output directory")
+    parser.add_argument("--format", choices=["png", "pdf"], default="png", help="Output format")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    tickers = [ticker.strip().upper() for ticker in args.tickers]
+    if args.tickers_file:
+        with open(args.tickers_file) as handle:
+            tickers += [line.strip().upper() for line in handle if line.strip()]
+    if not tickers:
+        parser.error("no tickers given")
+
+    print(f"📊 Rendering {len(tickers)} tickers to {args.out}/ ...")
+    charts, failures, seconds = generate_reports(
+        tickers, args.start, args.end, args.out, args.format, args.workers
+    )
+    for ticker, error in failures:
+        print(f"⚠️ {ticker}: {error}")
+    rate = charts / seconds if seconds else 0.0
+    print(f"✅ Rendered {charts} charts in {seconds:.1f}s ({rate:.1f} charts/s)")
+
+
+if __name__ == "__main__":
+    main()
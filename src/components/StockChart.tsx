@@ -4,6 +4,7 @@ import { Calendar, TrendingUp, TrendingDown } from 'lucide-react';
 import { HistoricalData, TechnicalIndicators, ForecastData } from '../types/stock';
 import { getHistoricalData, formatCurrency } from '../utils/stockApi';
 import { calculateTechnicalIndicators, generateForecast } from '../utils/technicalAnalysis';
+import { getPrecomputedAnalysis } from '../utils/indicatorApi';
 
 interface StockChartProps {
   symbol: string;
@@ -28,10 +29,11 @@ const StockChart: React.FC<StockChartProps> = ({ symbol }) => {
     const fetchData = async () => {
       setIsLoading(true);
       try {
-        const data = await getHistoricalData(symbol, selectedPeriod);
+        const precomputed = await getPrecomputedAnalysis(symbol, selectedPeriod);
+        const data = precomputed ? precomputed.historicalData : await getHistoricalData(symbol, selectedPeriod);
         setHistoricalData(data);
         
-        const technicalIndicators = calculateTechnicalIndicators(data);
+        const technicalIndicators = precomputed ? precomputed.indicators : calculateTechnicalIndicators(data);
         setIndicators(technicalIndicators);
         
         const forecastData = generateForecast(data);
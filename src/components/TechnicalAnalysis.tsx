@@ -4,6 +4,7 @@ import { Activity, TrendingUp, AlertTriangle, Target } from 'lucide-react';
 import { HistoricalData, TechnicalIndicators, InvestmentRecommendation } from '../types/stock';
 import { getHistoricalData } from '../utils/stockApi';
 import { calculateTechnicalIndicators, generateInvestmentRecommendation } from '../utils/technicalAnalysis';
+import { getPrecomputedAnalysis } from '../utils/indicatorApi';
 
 interface TechnicalAnalysisProps {
   symbol: string;
@@ -18,6 +19,13 @@ const TechnicalAnalysis: React.FC<TechnicalAnalysisProps> = ({ symbol }) => {
     const fetchAnalysis = async () => {
       setIsLoading(true);
       try {
+        const precomputed = await getPrecomputedAnalysis(symbol, '1Y');
+        if (precomputed) {
+          setIndicators(precomputed.indicators);
+          setRecommendation(precomputed.recommendation);
+          return;
+        }
+
         const historicalData = await getHistoricalData(symbol, '1Y');
         const technicalIndicators = calculateTechnicalIndicators(historicalData);
         const investmentRec = generateInvestmentRecommendation(historicalData, technicalIndicators);
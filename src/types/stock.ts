@@ -40,4 +40,25 @@ export interface InvestmentRecommendation {
   reasons: string[];
   targetPrice: number;
   riskLevel: 'LOW' | 'MEDIUM' | 'HIGH';
+}
+
+export interface IndicatorPayload {
+  version: number;
+  symbol: string;
+  period: string;
+  columns: {
+    date: string[];
+    open: number[];
+    high: number[];
+    low: number[];
+    close: number[];
+    volume: number[];
+    sma20: (number | null)[];
+    sma50: (number | null)[];
+    rsi: (number | null)[];
+    macd: (number | null)[];
+    signal: (number | null)[];
+    histogram: (number | null)[];
+  };
+  recommendation: InvestmentRecommendation;
 }
\ No newline at end of file
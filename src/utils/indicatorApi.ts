@@ -0,0 +1,54 @@
+import { HistoricalData, TechnicalIndicators, InvestmentRecommendation, IndicatorPayload } from '../types/stock';
+
+const INDICATOR_API_URL = import.meta.env.VITE_INDICATOR_API_URL || 'http://localhost:8000';
+const PAYLOAD_VERSION = 1;
+
+export interface PrecomputedAnalysis {
+  historicalData: HistoricalData[];
+  indicators: TechnicalIndicators;
+  recommendation: InvestmentRecommendation;
+}
+
+const toSeries = (values: (number | null)[]): number[] => values.map(v => (v === null ? NaN : v));
+
+export const getPrecomputedAnalysis = async (symbol: string, period: string = '1Y'): Promise<PrecomputedAnalysis | null> => {
+  // The browser revalidates with the server's ETag, so repeat loads are a 304
+  try {
+    const response = await fetch(
+      `${INDICATOR_API_URL}/api/v${PAYLOAD_VERSION}/indicators/${encodeURIComponent(symbol)}?period=${period}`
+    );
+    if (!response.ok) {
+      return null;
+    }
+
+    const payload: IndicatorPayload = await response.json();
+    if (payload.version !== PAYLOAD_VERSION) {
+      return null;
+    }
+
+    const { columns } = payload;
+    const historicalData: HistoricalData[] = columns.date.map((date, i) => ({
+      date,
+      open: columns.open[i],
+      high: columns.high[i],
+      low: columns.low[i],
+      close: columns.close[i],
+      volume: columns.volume[i]
+    }));
+
+    return {
+      historicalData,
+      indicators: {
+        sma20: toSeries(columns.sma20),
+        sma50: toSeries(columns.sma50),
+        rsi: toSeries(columns.rsi),
+        macd: toSeries(columns.macd),
+        signal: toSeries(columns.signal)
+      },
+      recommendation: payload.recommendation
+    };
+  } catch {
+    // No indicator server (e.g. static hosting): callers compute locally instead
+    return null;
+  }
+};
@@ -1,36 +1,45 @@
 import { HistoricalData, TechnicalIndicators, ForecastData, InvestmentRecommendation } from '../types/stock';
 
+// Local fallback for when the indicator API is unavailable; mirrors
+// calculate_technical_indicators in analysis.py using running window sums.
 export const calculateSMA = (data: number[], period: number): number[] => {
   const sma: number[] = [];
+  let sum = 0;
   for (let i = 0; i < data.length; i++) {
-    if (i < period - 1) {
-      sma.push(NaN);
-    } else {
-      const sum = data.slice(i - period + 1, i + 1).reduce((a, b) => a + b, 0);
-      sma.push(sum / period);
+    sum += data[i];
+    if (i >= period) {
+      sum -= data[i - period];
     }
+    sma.push(i < period - 1 ? NaN : sum / period);
   }
   return sma;
 };
 
 export const calculateRSI = (prices: number[], period: number = 14): number[] => {
   const rsi: number[] = [];
-  const gains: number[] = [];
-  const losses: number[] = [];
-  
-  for (let i = 1; i < prices.length; i++) {
-    const change = prices[i] - prices[i - 1];
-    gains.push(change > 0 ? change : 0);
-    losses.push(change < 0 ? Math.abs(change) : 0);
-  }
+  const gains: number[] = [0];
+  const losses: number[] = [0];
+  let gainSum = 0;
+  let lossSum = 0;
   
   for (let i = 0; i < prices.length; i++) {
-    if (i < period) {
+    if (i > 0) {
+      const change = prices[i] - prices[i - 1];
+      gains.push(change > 0 ? change : 0);
+      losses.push(change < 0 ? Math.abs(change) : 0);
+      gainSum += gains[i];
+      lossSum += losses[i];
+      if (i >= period) {
+        gainSum -= gains[i - period];
+        lossSum -= losses[i - period];
+      }
+    }
+
+    // The first window counts the missing change before prices[0] as zero, as pandas does
+    if (i < period - 1) {
       rsi.push(NaN);
     } else {
-      const avgGain = gains.slice(i - period, i).reduce((a, b) => a + b, 0) / period;
-      const avgLoss = losses.slice(i - period, i).reduce((a, b) => a + b, 0) / period;
-      const rs = avgGain / avgLoss;
+      const rs = (gainSum / period) / (lossSum / period);
       rsi.push(100 - (100 / (1 + rs)));
     }
   }
@@ -47,16 +56,17 @@ export const calculateMACD = (prices: number[]): { macd: number[], signal: numbe
   return { macd, signal };
 };
 
+// Adjusted exponential average, matching pandas ewm(span=period).mean()
 const calculateEMA = (data: number[], period: number): number[] => {
   const ema: number[] = [];
-  const multiplier = 2 / (period + 1);
+  const decay = 1 - 2 / (period + 1);
+  let weightedSum = 0;
+  let weightTotal = 0;
   
   for (let i = 0; i < data.length; i++) {
-    if (i === 0) {
-      ema.push(data[i]);
-    } else {
-      ema.push((data[i] * multiplier) + (ema[i - 1] * (1 - multiplier)));
-    }
+    weightedSum = data[i] + decay * weightedSum;
+    weightTotal = 1 + decay * weightTotal;
+    ema.push(weightedSum / weightTotal);
   }
   
   return ema;
@@ -4,8 +4,11 @@ import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
-from datetime import datetime, timedelta
+from datetime import timedelta
 import time
+from analysis import DEMO_STOCKS, generate_historical_data, calculate_technical_indicators, generate_investment_recommendation
+from symbols import SymbolDirectory, paginate
+from interchange import table_to_bytes, to_arrow_table
 
 # Page configuration
 st.set_page_config(
@@ -70,188 +73,10 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Demo stock data
-DEMO_STOCKS = {
-    'AAPL': {
-        'name': 'Apple Inc.',
-        'price': 178.25,
-        'change': 2.34,
-        'change_percent': 1.33,
-        'volume': 45234567,
-        'market_cap': 2800000000000,
-        'pe_ratio': 28.5,
-        'high_52w': 198.23,
-        'low_52w': 124.17
-    },
-    'MSFT': {
-        'name': 'Microsoft Corporation',
-        'price': 378.85,
-        'change': -1.22,
-        'change_percent': -0.32,
-        'volume': 23456789,
-        'market_cap': 2820000000000,
-        'pe_ratio': 32.1,
-        'high_52w': 384.30,
-        'low_52w': 245.61
-    },
-    'GOOGL': {
-        'name': 'Alphabet Inc.',
-        'price': 138.93,
-        'change': 3.45,
-        'change_percent': 2.55,
-        'volume': 34567890,
-        'market_cap': 1750000000000,
-        'pe_ratio': 25.8,
-        'high_52w': 153.78,
-        'low_52w': 102.21
-    },
-    'TSLA': {
-        'name': 'Tesla, Inc.',
-        'price': 248.50,
-        'change': -8.75,
-        'change_percent': -3.40,
-        'volume': 67890123,
-        'market_cap': 790000000000,
-        'pe_ratio': 78.2,
-        'high_52w': 299.29,
-        'low_52w': 138.80
-    },
-    'AMZN': {
-        'name': 'Amazon.com Inc.',
-        'price': 145.86,
-        'change': 1.23,
-        'change_percent': 0.85,
-        'volume': 28456789,
-        'market_cap': 1520000000000,
-        'pe_ratio': 45.3,
-        'high_52w': 170.00,
-        'low_52w': 118.35
-    }
-}
-
-def generate_historical_data(symbol, days=365):
-    """Generate realistic historical stock data"""
-    np.random.seed(hash(symbol) % 2**32)  # Consistent data for same symbol
-    
-    base_price = DEMO_STOCKS[symbol]['price']
-    current_price = base_price * 0.8  # Start from 80% of current price
-    
-    dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
-    data = []
-    
-    for date in dates:
-        # Simulate realistic price movement
-        volatility = 0.02  # 2% daily volatility
-        trend = 0.0003  # Slight upward trend
-        change = np.random.normal(trend, volatility)
-        
-        current_price = max(current_price * (1 + change), 1)
-        
-        open_price = current_price
-        high_price = open_price * (1 + np.random.uniform(0, 0.03))
-        low_price = open_price * (1 - np.random.uniform(0, 0.03))
-        close_price = low_price + np.random.uniform(0, 1) * (high_price - low_price)
-        volume = np.random.randint(10000000, 50000000)
-        
-        data.append({
-            'Date': date,
-            'Open': round(open_price, 2),
-            'High': round(high_price, 2),
-            'Low': round(low_price, 2),
-            'Close': round(close_price, 2),
-            'Volume': volume
-        })
-        
-        current_price = close_price
-    
-    return pd.DataFrame(data)
-
-def calculate_technical_indicators(df):
-    """Calculate technical indicators"""
-    # Simple Moving Averages
-    df['SMA_20'] = df['Close'].rolling(window=20).mean()
-    df['SMA_50'] = df['Close'].rolling(window=50).mean()
-    
-    # RSI
-    delta = df['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    df['RSI'] = 100 - (100 / (1 + rs))
-    
-    # MACD
-    exp1 = df['Close'].ewm(span=12).mean()
-    exp2 = df['Close'].ewm(span=26).mean()
-    df['MACD'] = exp1 - exp2
-    df['MACD_Signal'] = df['MACD'].ewm(span=9).mean()
-    df['MACD_Histogram'] = df['MACD'] - df['MACD_Signal']
-    
-    return df
-
-def generate_investment_recommendation(df, stock_data):
-    """Generate investment recommendation based on technical analysis"""
-    latest_rsi = df['RSI'].iloc[-1]
-    latest_price = df['Close'].iloc[-1]
-    latest_sma20 = df['SMA_20'].iloc[-1]
-    latest_sma50 = df['SMA_50'].iloc[-1]
-    latest_macd = df['MACD'].iloc[-1]
-    latest_signal = df['MACD_Signal'].iloc[-1]
-    
-    score = 50  # Neutral score
-    reasons = []
-    
-    # RSI Analysis
-    if latest_rsi < 30:
-        score += 15
-        reasons.append("RSI indicates oversold conditions (bullish)")
-    elif latest_rsi > 70:
-        score -= 15
-        reasons.append("RSI indicates overbought conditions (bearish)")
-    
-    # Moving Average Analysis
-    if latest_price > latest_sma20 and latest_sma20 > latest_sma50:
-        score += 10
-        reasons.append("Price above both moving averages (bullish trend)")
-    elif latest_price < latest_sma20 and latest_sma20 < latest_sma50:
-        score -= 10
-        reasons.append("Price below both moving averages (bearish trend)")
-    
-    # MACD Analysis
-    if latest_macd > latest_signal:
-        score += 8
-        reasons.append("MACD above signal line (bullish momentum)")
-    else:
-        score -= 8
-        reasons.append("MACD below signal line (bearish momentum)")
-    
-    # Volume analysis
-    avg_volume = df['Volume'].tail(10).mean()
-    latest_volume = df['Volume'].iloc[-1]
-    if latest_volume > avg_volume * 1.2:
-        score += 5
-        reasons.append("Above average trading volume")
-    
-    # Determine recommendation
-    if score >= 65:
-        action = "BUY"
-        target_price = latest_price * 1.15
-        risk_level = "MEDIUM" if latest_rsi > 60 else "LOW"
-    elif score <= 35:
-        action = "SELL"
-        target_price = latest_price * 0.85
-        risk_level = "HIGH" if latest_rsi < 40 else "MEDIUM"
-    else:
-        action = "HOLD"
-        target_price = latest_price
-        risk_level = "MEDIUM"
-    
-    return {
-        'action': action,
-        'score': score,
-        'target_price': target_price,
-        'risk_level': risk_level,
-        'reasons': reasons
-    }
+@st.cache_resource
+def get_symbol_directory():
+    """Build the searchable symbol directory once per process"""
+    return SymbolDirectory((symbol, info['name']) for symbol, info in DEMO_STOCKS.items())
 
 def format_currency(value):
     """Format number as currency"""
@@ -279,10 +104,22 @@ def main():
     with st.sidebar:
         st.header("🔍 Stock Selection")
         
-        selected_symbol = st.selectbox(
+        directory = get_symbol_directory()
+        query = st.text_input("Search ticker or company:", "").strip()
+        results = directory.search(query, limit=500) if query else []
+        if query and not results:
+            st.warning("No matching symbols found; showing all symbols.")
+        if not results:
+            results = list(zip(directory.symbols, directory.names))
+        
+        page_count = paginate(results, 1)[1]
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1) if page_count > 1 else 1
+        page_results = paginate(results, page)[0]
+        
+        selected_symbol = st.radio(
             "Choose a stock:",
-            options=list(DEMO_STOCKS.keys()),
-            format_func=lambda x: f"{x} - {DEMO_STOCKS[x]['name']}"
+            options=[symbol for symbol, _ in page_results],
+            format_func=lambda x: f"{x} - {directory.name(x)}"
         )
         
         st.header("📊 Analysis Options")
@@ -524,6 +361,33 @@ def main():
         avg_volume = df['Volume'].mean()
         st.metric("Avg Volume", format_number(avg_volume))
     
+    # Data export
+    with st.expander("💾 Export Data"):
+        # Streamlit renders Arrow tables directly, without another pandas copy
+        indicator_table = to_arrow_table(df)
+        st.dataframe(indicator_table, use_container_width=True)
+        
+        recommendation_rows = [{'Symbol': selected_symbol, **recommendation}]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.download_button(
+                "Indicators (Parquet)",
+                table_to_bytes(indicator_table, 'parquet'),
+                file_name=f"{selected_symbol}_indicators.parquet"
+            )
+        with col2:
+            st.download_button(
+                "Indicators (Arrow)",
+                table_to_bytes(indicator_table, 'arrow'),
+                file_name=f"{selected_symbol}_indicators.arrow"
+            )
+        with col3:
+            st.download_button(
+                "Recommendation (Parquet)",
+                table_to_bytes(recommendation_rows, 'parquet'),
+                file_name=f"{selected_symbol}_recommendation.parquet"
+            )
+    
     # Footer
     st.markdown("---")
     st.markdown("""
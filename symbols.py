@@ -0,0 +1,178 @@
+# symbols.py
+
+import csv
+from bisect import bisect_left
+from collections import defaultdict
+
+DEFAULT_PAGE_SIZE = 20
+
+
+def _words(text):
+    """Lowercase words of a name or query, trimmed of punctuation"""
+    words = (word.strip(".,&()") for word in text.lower().split())
+    return [word for word in words if word]
+
+
+def _trigrams(text):
+    """Return the set of padded trigrams for a lowercase string"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _PrefixIndex:
+    """Sorted (key, position) pairs bucketed by key length"""
+
+    def __init__(self, pairs):
+        buckets = defaultdict(list)
+        for key, i in pairs:
+            buckets[len(key)].append((key, i))
+        self._buckets = sorted((length, sorted(keys)) for length, keys in buckets.items())
+
+    def matches(self, prefix, limit=None):
+        """Yield (extra_chars, position), shortest keys first, at most limit items"""
+        found = 0
+        for length, keys in self._buckets:
+            if length < len(prefix):
+                continue
+            start = bisect_left(keys, (prefix,))
+            for key, i in keys[start:]:
+                if not key.startswith(prefix):
+                    break
+                yield length - len(prefix), i
+                found += 1
+                if limit is not None and found >= limit:
+                    return
+
+    def count(self, prefix):
+        """Number of keys starting with prefix, without scanning them"""
+        total = 0
+        for length, keys in self._buckets:
+            if length >= len(prefix):
+                total += bisect_left(keys, (prefix + "\uffff",)) - bisect_left(keys, (prefix,))
+        return total
+
+
+class SymbolDirectory:
+    """Ticker/company lookup with prebuilt prefix and trigram indexes"""
+
+    def __init__(self, entries):
+        # De-duplicate on symbol, keeping the first name seen
+        seen = {}
+        for symbol, name in entries:
+            symbol = symbol.strip().upper()
+            if symbol and symbol not in seen:
+                seen[symbol] = (name or "").strip()
+
+        self.symbols = sorted(seen)
+        self.names = [seen[symbol] for symbol in self.symbols]
+        self._position = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        self._symbol_index = _PrefixIndex((symbol, i) for i, symbol in enumerate(self.symbols))
+        self._entry_words = [tuple(_words(name)) for name in self.names]
+        self._word_index = _PrefixIndex(
+            {(word, i) for i, words in enumerate(self._entry_words) for word in words}
+        )
+
+        # Trigram postings over "symbol name" for fuzzy matching, in position order
+        postings = defaultdict(list)
+        for i, (symbol, name) in enumerate(zip(self.symbols, self.names)):
+            for gram in _trigrams(f"{symbol} {name}".lower()):
+                postings[gram].append(i)
+        self._trigram_postings = dict(postings)
+        # Trigrams shared by more than this many entries carry little signal
+        self._common_gram_size = max(len(self.symbols) // 10, 100)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __contains__(self, symbol):
+        return symbol.strip().upper() in self._position
+
+    def name(self, symbol):
+        """Company name for a symbol, or None if unknown"""
+        i = self._position.get(symbol.strip().upper())
+        return None if i is None else self.names[i]
+
+    def search(self, query, limit=50):
+        """Rank symbols by exact, prefix, company-word and fuzzy trigram match"""
+        query = query.strip()
+        if not query:
+            return []
+
+        scores = {}
+
+        def offer(i, score):
+            if score > scores.get(i, 0):
+                scores[i] = score
+
+        # Exact ticker first, then the shortest tickers sharing the prefix
+        for extra, i in self._symbol_index.matches(query.upper(), limit):
+            offer(i, 100 if extra == 0 else 90 - min(extra, 9))
+
+        words = _words(query)
+        if len(words) == 1:
+            # Scores only depend on word length, so the shortest `limit` words rank first
+            for extra, i in self._word_index.matches(words[0], limit):
+                offer(i, 70 if extra == 0 else 60 - min(extra, 9))
+        elif words:
+            # Candidates come from the most selective word that matches anything
+            # (others may be typos); every word is then scored against them
+            counts = {word: self._word_index.count(word) for word in words}
+            present = [word for word in words if counts[word]]
+            rarest = min(present, key=counts.get) if present else None
+            candidates = {i for _, i in self._word_index.matches(rarest)} if rarest else set()
+            for i in candidates:
+                total = 0
+                for word in words:
+                    extras = [len(name_word) - len(word) for name_word in self._entry_words[i]
+                              if name_word.startswith(word)]
+                    if extras:
+                        extra = min(extras)
+                        total += 70 if extra == 0 else 60 - min(extra, 9)
+                offer(i, total // len(words))
+
+        # Fall back to trigram similarity if the cheap lookups are short, and
+        # always for multi-word queries, which may contain typos in any word
+        if len(scores) < limit or len(words) > 1:
+            query_grams = _trigrams(query.lower())
+            grams = [gram for gram in query_grams if gram in self._trigram_postings]
+            rare = [gram for gram in grams
+                    if len(self._trigram_postings[gram]) <= self._common_gram_size]
+            common = [gram for gram in grams if gram not in rare]
+
+            # Rare trigrams pick the candidates; common ones are only probed for them
+            counts = defaultdict(int)
+            for gram in rare or common:
+                for i in self._trigram_postings[gram]:
+                    counts[i] += 1
+            if rare:
+                for gram in common:
+                    postings = self._trigram_postings[gram]
+                    for i in counts:
+                        j = bisect_left(postings, i)
+                        if j < len(postings) and postings[j] == i:
+                            counts[i] += 1
+
+            for i, count in counts.items():
+                ratio = count / len(query_grams)
+                if ratio >= 0.5:
+                    offer(i, int(50 * ratio))
+
+        # Positions are in symbol order, so ties break alphabetically
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.symbols[i], self.names[i]) for i, _ in ranked[:limit]]
+
+
+def load_symbol_directory(path):
+    """Load a SymbolDirectory from a CSV file with Symbol and Name columns"""
+    with open(path, newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        return SymbolDirectory((row.get("Symbol", ""), row.get("Name", "")) for row in reader)
+
+
+def paginate(results, page, page_size=DEFAULT_PAGE_SIZE):
+    """Return (page_results, page_count) for a 1-based page number"""
+    page_count = max(1, -(-len(results) // page_size))
+    page = min(max(page, 1), page_count)
+    start = (page - 1) * page_size
+    return results[start:start + page_size], page_count